@@ -13,18 +13,26 @@ Usage:
     hs.shutdown()
 
 Protocol Based On: Real Hamilton HHS commands from PyLabRobot implementation
+
+Async convention: a cooperative yield is `await _yield()` (asyncio.sleep(0),
+which takes asyncio's no-timer fast path); never a tiny positive sleep such
+as asyncio.sleep(0.001), which schedules a timer and adds latency.
 """
 
 import asyncio
+import concurrent.futures
+import functools
+import os
+import re
+import sys
+import threading
 import time
-import struct
-from typing import Optional, Union, Literal
+from typing import NamedTuple, Optional, Union, Literal
 from enum import Enum
 import logging
 
 try:
-    import serial
-    import serial.tools.list_ports
+    import serial  # serial.tools.list_ports is imported on first list_available_ports()
     SERIAL_AVAILABLE = True
 except ImportError:
     SERIAL_AVAILABLE = False
@@ -38,6 +46,63 @@ except ImportError:
     USB_AVAILABLE = False
     print("Warning: pyusb not installed. Install with: pip install pyusb")
 
+_log = logging.getLogger(__name__)
+
+
+# Zero-padded protocol fields for every value the device accepts, built once
+# at import so formatting a command is a tuple lookup
+_ID_STR = tuple(f"{i:04d}" for i in range(10000))      # command IDs 0000-9999
+_ID_BYTES = tuple(i.encode('ascii') for i in _ID_STR)  # same, pre-encoded for frame templates
+_TEMP_STR = tuple(f"{i:04d}" for i in range(1151))     # 0.0-115.0°C in tenths
+_TEMP_BYTES = tuple(i.encode('ascii') for i in _TEMP_STR)
+_SPEED_STR = tuple(f"{i:04d}" for i in range(2001))    # up to 2000 increments/s
+_ACCEL_STR = tuple(f"{i:05d}" for i in range(10001))   # up to 10000 increments/s²
+
+
+# Status reply of the QE query, compiled once at import
+_QE_RE = re.compile(rb'qe(\d{2})')                # last temperature error code
+
+# Temperature controller error codes (Hamilton Manual E289247a), reported by TW and TB
+_TEMP_ERRORS = {
+    "61": "Temperature timeout - target not reached in time",
+    "62": "Temperature out of supervision range",
+    "63": "Temperature out of security range - heating disabled",
+    "64": "Temperature sensor error - no connection to sensors or sensor difference too big",
+}
+
+
+async def _yield():
+    """Let other ready tasks run once (asyncio.sleep(0) fast path, no timer)."""
+    await asyncio.sleep(0)
+
+
+def _signed_field(frame: bytes, at: int) -> Optional[int]:
+    """Value of a fixed-width "+dddd"/"-dddd" field at offset at, None if not one."""
+    digits = frame[at + 1:at + 5]
+    if len(digits) != 4 or not digits.isdigit():
+        return None
+    sign = frame[at]
+    if sign == 0x2B:  # '+'
+        return int(digits)
+    if sign == 0x2D:  # '-'
+        return -int(digits)
+    return None
+
+
+def _frame_id(frame: bytes) -> Optional[bytes]:
+    """
+    Extract the correlation key of a command or response frame.
+    
+    This is the 4-digit command ID, prefixed with the T{index} device
+    address when present, so devices sharing one port are told apart.
+    """
+    start = frame.find(b'id')
+    if start < 0 or start + 6 > len(frame):
+        return None
+    if frame[:1] == b'T' and frame[1:2].isdigit():
+        return frame[:2] + frame[start + 2:start + 6]
+    return frame[start + 2:start + 6]
+
 
 class InterfaceType(Enum):
     """Communication interface types."""
@@ -45,6 +110,22 @@ class InterfaceType(Enum):
     USB = "usb"      # USB connection via heater shaker box
 
 
+class HHSReply(NamedTuple):
+    """Parsed Hamilton HHS response (see HHSCommands.parse_response)."""
+    success: bool
+    command_id: Optional[bytes]  # 4-digit ID echoed by the device
+    error_code: Optional[str]  # 2-digit 'er' code; "00" means success
+    raw: bytes                 # Response frame as received (CR/LF stripped)
+    error: Optional[str]       # Error description when not successful
+
+
+class PortInfo(NamedTuple):
+    """Serial port entry returned by HeaterShaker.list_available_ports()."""
+    device: str
+    description: str
+    manufacturer: str
+
+
 class HHSCommands:
     """
     Hamilton Heater Shaker command constants.
@@ -73,6 +154,7 @@ class HHSCommands:
     # USB device IDs (from PyLabRobot)
     USB_VENDOR_ID = 0x8AF     # Hamilton vendor ID
     USB_PRODUCT_ID = 0x8002   # Heater Shaker product ID
+    USB_ID_STR = f"{USB_VENDOR_ID:04X}:{USB_PRODUCT_ID:04X}"  # VID:PID as shown by lsusb/Device Manager
     
     @staticmethod
     def build_command(index: int, command: str, command_id: int, interface_type: str = "usb", **kwargs) -> str:
@@ -93,8 +175,8 @@ class HHSCommands:
             USB: build_command(1, "TA", 123, "usb", ta="0370") -> "T1TAid0123ta0370"
             RS232: build_command(1, "TA", 123, "rs232", ta="0370") -> "TAid0123ta0370"
         """
-        args = "".join([f"{key}{value}" for key, value in kwargs.items()])
-        id_str = str(command_id).zfill(4)
+        args = "".join(f"{key}{value}" for key, value in kwargs.items())
+        id_str = _ID_STR[command_id] if 0 <= command_id < 10000 else f"{command_id:04d}"
         
         # Only include T{index} prefix for USB box control (not for STAR RS232)
         if interface_type == "usb":
@@ -102,129 +184,328 @@ class HHSCommands:
         else:
             return f"{command}id{id_str}{args}"
     
+    # Frame templates for build_command_bytes: (index,) command, id, args
+    _USB_TEMPLATE = b"T%d%bid%04d%b\r\n"
+    _RS232_TEMPLATE = b"%bid%04d%b\r\n"
+    
+    @staticmethod
+    def build_command_bytes(index: int, command: str, command_id: int, interface_type: str = "usb", **kwargs) -> bytes:
+        """
+        Build the encoded, CR/LF-terminated command frame sent on the wire.
+        
+        Formats straight into bytes from the frame templates, without an
+        intermediate command str.
+        """
+        args = "".join(f"{key}{value}" for key, value in kwargs.items()).encode('ascii')
+        if interface_type == "usb":
+            return HHSCommands._USB_TEMPLATE % (index, command.encode('ascii'), command_id, args)
+        return HHSCommands._RS232_TEMPLATE % (command.encode('ascii'), command_id, args)
+    
+    @staticmethod
+    def build_command_into(buf, index: int, command: str, command_id: int, interface_type: str = "usb",
+                           **kwargs) -> int:
+        """
+        Write the encoded, CR/LF-terminated command frame into a caller-owned buffer.
+        
+        Lets control loops reuse one scratch bytearray (or memoryview) instead
+        of building a new str and bytes object per command.
+        
+        Args:
+            buf: Writable buffer, reused across calls
+            (remaining arguments as for build_command)
+            
+        Returns:
+            Number of bytes written; the frame is buf[:n]
+        """
+        frame = HHSCommands.build_command_bytes(index, command, command_id, interface_type, **kwargs)
+        n = len(frame)
+        if n > len(buf):
+            raise ValueError(f"Buffer too small for command frame ({n} bytes)")
+        buf[:n] = frame
+        return n
+    
     @staticmethod
     def format_temperature(temp_celsius: float) -> str:
-        """Format temperature for Hamilton protocol (temp * 10 as 4-digit string)."""
-        return f"{round(10 * temp_celsius):04d}"
+        """
+        Format temperature for Hamilton protocol (temp * 10 as 4-digit string).
+        
+        Pure integer path: the value is rounded to tenths once and the digits
+        come from the precomputed table. Values below zero keep four digits
+        after the sign ("-0050").
+        """
+        tenths = round(10 * temp_celsius)
+        if 0 <= tenths < len(_TEMP_STR):
+            return _TEMP_STR[tenths]
+        if tenths < 0:
+            return "-%04d" % -tenths
+        return "%04d" % tenths
+    
+    @staticmethod
+    def format_temperature_bytes(temp_celsius: float) -> bytes:
+        """Format temperature like format_temperature, pre-encoded for frame templates."""
+        tenths = round(10 * temp_celsius)
+        if 0 <= tenths < len(_TEMP_BYTES):
+            return _TEMP_BYTES[tenths]
+        if tenths < 0:
+            return b"-%04d" % -tenths
+        return b"%04d" % tenths
     
     @staticmethod
     def format_speed(speed_increments_per_sec: int) -> str:
         """Format speed for Hamilton protocol (4-digit zero-padded)."""
-        return f"{speed_increments_per_sec:04d}"
+        if 0 <= speed_increments_per_sec < len(_SPEED_STR):
+            return _SPEED_STR[speed_increments_per_sec]
+        return "%04d" % speed_increments_per_sec
     
     @staticmethod
     def format_acceleration(accel: int) -> str:
         """Format acceleration for Hamilton protocol (5-digit zero-padded)."""
-        return f"{accel:05d}"
+        if 0 <= accel < len(_ACCEL_STR):
+            return _ACCEL_STR[accel]
+        return "%05d" % accel
     
     @staticmethod
-    def parse_temperature_response(response: str) -> dict:
+    def parse_temperature_response(response: Union[bytes, str]) -> dict:
         """
         Parse Hamilton temperature response.
         
-        Response format: "...er00rt+0370 +0365..." or "...rt+0370 +0365..."
-        (middle temp, edge temp in tenths of degrees)
+        Response format: "[T1]RTid0001er00rt+0370 +0365" or "[T1]RTid0001rt+0370 +0365"
+        (middle temp, edge temp in tenths of degrees). Frames that are not an
+        RT reply are rejected.
         """
         result = {'middle': None, 'edge': None, 'success': False}
+        if isinstance(response, str):
+            response = response.encode('ascii', 'replace')
+        
+        # Locate 'rt' after the RT header
+        rt_at = response.find(b'rt')
+        if rt_at < 0 or response.find(b'RTid', 0, rt_at) < 0:
+            return result
+        
+        # Fixed-width layout "rt+0370 +0365": read both fields at known offsets
+        middle = _signed_field(response, rt_at + 2)
+        edge = _signed_field(response, rt_at + 8)
+        if middle is not None and edge is not None and response[rt_at + 7:rt_at + 8] == b' ' \
+                and not response[rt_at + 13:rt_at + 14].strip():
+            result.update({'middle': middle / 10, 'edge': edge / 10, 'success': True})
+            return result
         
+        # Otherwise let int() read the two signed fields straight from slices
+        # (it skips the surrounding whitespace)
+        fields = response[rt_at + 2:]
+        split_at = fields.find(b' ', 1)
+        if split_at < 0:
+            return result
         try:
-            # Find the temperature data after 'rt'
-            if 'rt' in response:
-                temp_part = response.split('rt')[1]
-                temps = temp_part.split()
-                
-                if len(temps) >= 2:
-                    # Remove any leading '+' or other characters and convert
-                    middle_str = temps[0].strip('+').strip()
-                    edge_str = temps[1].strip('+').strip()
-                    
-                    # Extract numeric part only
-                    import re
-                    middle_match = re.search(r'[+-]?\d+', middle_str)
-                    edge_match = re.search(r'[+-]?\d+', edge_str)
-                    
-                    if middle_match and edge_match:
-                        middle_temp = float(middle_match.group()) / 10
-                        edge_temp = float(edge_match.group()) / 10
-                        
-                        result.update({
-                            'middle': middle_temp,
-                            'edge': edge_temp,
-                            'success': True
-                        })
-        except Exception as e:
-            result['error'] = f"Parse error: {e}"
+            middle, edge = int(fields[:split_at]), int(fields[split_at:])
+        except ValueError:
+            return result
         
+        result.update({
+            'middle': middle / 10,
+            'edge': edge / 10,
+            'success': True
+        })
         return result
     
     @staticmethod
-    def parse_shaking_response(response: str) -> bool:
+    def parse_shaking_response(response: Union[bytes, str]) -> bool:
         """Parse shaking status response (RD command returns rd0 or rd1)."""
-        # Look for rd0 (not moving) or rd1 (moving) pattern
-        if 'rd0' in response:
-            return False
-        elif 'rd1' in response:
-            return True
-        else:
-            # If neither pattern found, assume not shaking
-            return False
+        if isinstance(response, str):
+            response = response.encode('ascii', 'replace')
+        
+        # Only rd1 (moving) means shaking; rd0 or no status means not shaking.
+        # One find for the status field, then its digit is compared in place.
+        rd_at = response.find(b'rd')
+        return rd_at >= 0 and response[rd_at + 2:rd_at + 3] == b'1'
     
     @staticmethod
-    def parse_response(response: str) -> dict:
+    def parse_response(response: Union[bytes, str]) -> HHSReply:
         """
-        Parse Hamilton HHS response string according to official manual.
+        Parse Hamilton HHS response according to official manual.
         
         Format: [Command]id[id]er[error_code][data]
         
         Returns:
-            Dictionary with parsed response data
+            HHSReply with the parsed response data
         """
-        result = {
-            'success': False,
-            'command_id': None,
-            'error_code': None,
-            'data': {},
-            'error': None,
-            'raw_response': response
-        }
+        if isinstance(response, str):
+            response = response.encode('ascii', 'replace')
         
         if not response:
-            result['error'] = "Empty response"
-            return result
+            return HHSReply(False, None, None, response, "Empty response")
+        
+        success = False
+        command_id = None
+        error_code = None
+        error = None
+        
+        # Extract command ID if present (one find per marker; 'er' follows the ID)
+        id_at = response.find(b'id')
+        if id_at >= 0 and id_at + 6 <= len(response):
+            command_id = response[id_at + 2:id_at + 6]
+        
+        # Extract error code (Hamilton manual: er## format)
+        er_at = response.find(b'er', id_at + 6 if id_at >= 0 else 0)
+        if er_at >= 0 and response.startswith(b'er00', er_at):
+            return HHSReply(True, command_id, "00", response, None)  # Common case, no decode
+        if er_at >= 0:
+            er_start = er_at + 2
+            if er_start + 2 <= len(response):
+                error_code = response[er_start:er_start+2].decode('ascii', 'replace')
+                
+                # Error code 00 means success
+                if error_code == "00":
+                    success = True
+                else:
+                    error = f"Hamilton error code: {error_code}"
+        else:
+            # If no error code found, assume success if we got a response
+            success = True
+        
+        return HHSReply(success, command_id, error_code, response, error)
+
+
+class CommInterface:
+    """
+    Base for the device transports: command submission and coalescing.
+    
+    Subclasses implement connect(), disconnect(), _check_connected() and
+    _blocking_send(frames), which writes the frames in one go and returns
+    one response per frame.
+    """
+    
+    def __init__(self):
+        self.is_connected = False
+        self._lock = asyncio.Lock()  # One write/read exchange on the device at a time
+        self._waiting = []           # (frames, future) submitted while an exchange was running
+        self._refcount = 0           # Devices currently sharing this transport
+        self._io_lock = threading.Lock()  # Serializes exchanges from the loop and from sync callers
+        # One I/O thread per transport: exchanges stay FIFO and never wait on other executor work
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=type(self).__name__)
+    
+    async def acquire(self) -> bool:
+        """Connect on first use; later devices share the open connection."""
+        async with self._lock:
+            if not self.is_connected and not await self.connect():
+                return False
+            self._refcount += 1
+            return True
+    
+    async def release(self) -> bool:
+        """Drop one user of the transport and disconnect when it was the last."""
+        async with self._lock:
+            self._refcount = max(0, self._refcount - 1)
+            if self._refcount or not self.is_connected:
+                return True
+            return await self.disconnect()
+    
+    async def send_command(self, command: str) -> Optional[bytes]:
+        """Send command and receive response."""
+        return await self.send_command_bytes(command.encode('ascii') + b'\r\n')
+    
+    async def send_command_bytes(self, frame: bytes) -> Optional[bytes]:
+        """Send an encoded, CR/LF-terminated command frame and receive the response."""
+        responses = await self.send_frames([frame])
+        return responses[0]
+    
+    async def send_commands(self, commands: list) -> list:
+        """Send several commands in a single write and read one response per command."""
+        return await self.send_frames([command.encode('ascii') + b'\r\n' for command in commands])
+    
+    async def send_frames(self, frames: list) -> list:
+        """
+        Send encoded command frames in a single write and read one response per frame.
+        
+        Frames submitted concurrently (e.g. from asyncio.gather) are coalesced:
+        whoever gets the device next writes everything that is waiting in one
+        go. The blocking I/O runs on the transport's own worker thread so the
+        event loop stays responsive while waiting for the device.
+        
+        Returns:
+            Responses in frame order (None for any that never arrived)
+        """
+        self._check_connected()
+        
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._waiting.append((frames, future))
         
         try:
-            # Extract command ID if present
-            if 'id' in response:
-                id_start = response.find('id') + 2
-                if id_start + 4 <= len(response):
-                    result['command_id'] = response[id_start:id_start+4]
+            if not self._lock.locked():
+                await _yield()  # Let other tasks of the same batch queue up
             
-            # Extract error code (Hamilton manual: er## format)
-            if 'er' in response:
-                er_start = response.find('er') + 2
-                if er_start + 2 <= len(response):
-                    error_code = response[er_start:er_start+2]
-                    result['error_code'] = error_code
+            async with self._lock:
+                if not future.done():
+                    # Callers cancelled while queued (e.g. by wait_for) are not sent
+                    batch = [entry for entry in self._waiting if not entry[1].done()]
+                    self._waiting = []
+                    all_frames = [frame for queued, _ in batch for frame in queued]
                     
-                    # Error code 00 means success
-                    if error_code == "00":
-                        result['success'] = True
-                    else:
-                        result['success'] = False
-                        result['error'] = f"Hamilton error code: {error_code}"
-            else:
-                # If no error code found, assume success if we got a response
-                result['success'] = True
-                
-        except Exception as e:
-            result['error'] = f"Parse error: {e}"
+                    exchange = loop.run_in_executor(self._executor, self._locked_send, all_frames)
+                    exchange.add_done_callback(functools.partial(self._deliver, batch))
+                    # Once written, the frames' replies belong to every caller in the
+                    # batch: if this task is cancelled the exchange still completes
+                    # and the others get their responses; only this caller sees the
+                    # cancellation
+                    await asyncio.shield(exchange)
+        except asyncio.CancelledError:
+            # Mark this caller's entry done: if it was still queued (cancelled
+            # while waiting for the lock, e.g. by wait_for), no later batch
+            # writes its frames
+            future.cancel()
+            raise
+        
+        return await future
+    
+    @staticmethod
+    def _deliver(batch: list, exchange: asyncio.Future):
+        """Hand each caller of a finished exchange its slice of the responses."""
+        if exchange.cancelled():
+            for _, queued_future in batch:
+                queued_future.cancel()
+            return
+        
+        error = exchange.exception()
+        start = 0
+        for queued, queued_future in batch:
+            if not queued_future.done():  # The caller may have been cancelled meanwhile
+                if error is not None:
+                    queued_future.set_exception(error)
+                else:
+                    queued_future.set_result(exchange.result()[start:start + len(queued)])
+            start += len(queued)
+    
+    def send_frames_sync(self, frames: list) -> list:
+        """
+        Blocking form of send_frames for synchronous callers.
         
-        return result
+        Runs the exchange on the calling thread, without an event loop round
+        trip; it waits for any exchange already running on the device.
+        """
+        self._check_connected()
+        return self._locked_send(frames)
+    
+    def _locked_send(self, frames: list) -> list:
+        with self._io_lock:
+            return self._blocking_send(frames)
+    
+    def _check_connected(self):
+        raise NotImplementedError
+    
+    def _blocking_send(self, frames: list) -> list:
+        raise NotImplementedError
 
 
-class SerialInterface:
+class SerialInterface(CommInterface):
     """RS232/Serial communication interface for Hamilton heater shaker."""
     
+    # Per-read pyserial timeout; the overall response deadline is self.timeout
+    READ_SLICE = 0.05
+    # Bound on out-of-order frames held for later commands
+    MAX_PENDING = 32
+    
     def __init__(self, port: str, baudrate: int = 9600, timeout: float = 2.0):
         """
         Initialize serial interface.
@@ -232,16 +513,19 @@ class SerialInterface:
         Args:
             port: Serial port (e.g., 'COM3' on Windows, '/dev/ttyUSB0' on Linux)
             baudrate: Communication speed (typically 9600 for Hamilton devices)
-            timeout: Read timeout in seconds
+            timeout: Response timeout in seconds
         """
         if not SERIAL_AVAILABLE:
             raise ImportError("pyserial is required for RS232 communication")
         
+        super().__init__()
         self.port = port
         self.baudrate = baudrate
         self.timeout = timeout
         self.serial_conn = None
-        self.is_connected = False
+        self._rx = bytearray()        # Received bytes not yet returned as a frame, kept across commands
+        self._pending = {}            # Command ID -> frame that arrived while waiting for another ID
+        self._rx_dirty = True         # Receive state untrusted (fresh port, failed exchange): flush before next write
     
     async def connect(self) -> bool:
         """Establish serial connection."""
@@ -252,72 +536,195 @@ class SerialInterface:
                 bytesize=serial.EIGHTBITS,
                 parity=serial.PARITY_NONE,
                 stopbits=serial.STOPBITS_ONE,
-                timeout=self.timeout
+                timeout=self.READ_SLICE
             )
+            self._enable_low_latency()
+            self._tune_latency_timer()
+            self._rx_dirty = True  # Drop whatever the device sent before we opened the port
             self.is_connected = True
-            logging.info(f"Connected to {self.port} at {self.baudrate} baud")
+            _log.info(f"Connected to {self.port} at {self.baudrate} baud")
             return True
         except Exception as e:
-            logging.error(f"Failed to connect to {self.port}: {e}")
+            _log.error("Failed to connect to %s: %s", self.port, e)
             return False
     
+    def _enable_low_latency(self):
+        """
+        Ask the tty driver for ASYNC_LOW_LATENCY (Linux).
+        
+        The driver then hands received bytes to the reader immediately
+        instead of batching them, cutting the wait on each short reply.
+        Drivers that do not support the flag (e.g. ptys) are left as is.
+        """
+        if not sys.platform.startswith("linux"):
+            return
+        
+        try:
+            self.serial_conn.set_low_latency_mode(True)
+        except (AttributeError, OSError, ValueError) as e:
+            _log.debug("Low-latency mode not available on %s: %s", self.port, e)
+    
+    def _tune_latency_timer(self):
+        """
+        Set the USB-serial adapter latency timer to 1 ms (Linux, FTDI adapters).
+        
+        FTDI chips hold received bytes for up to 16 ms by default before
+        passing them to the host, which dominates each short HHS exchange.
+        The driver exposes the timer in sysfs; adapters without it (e.g.
+        CH340, native UARTs) are left alone. On Windows the timer is a
+        driver setting (Device Manager > Port Settings > Advanced).
+        """
+        if not sys.platform.startswith("linux"):
+            return
+        
+        tty_name = os.path.basename(os.path.realpath(self.port))
+        path = f"/sys/bus/usb-serial/devices/{tty_name}/latency_timer"
+        if not os.path.exists(path):
+            return
+        
+        try:
+            with open(path) as f:
+                if f.read().strip() == "1":
+                    return
+            with open(path, "w") as f:
+                f.write("1")
+            _log.info(f"Set latency timer of {tty_name} to 1 ms")
+        except OSError as e:
+            _log.warning("Could not set latency timer of %s (%s); "
+                         "responses may be delayed by up to 16 ms", tty_name, e)
+    
     async def disconnect(self) -> bool:
         """Close serial connection."""
         try:
             if self.serial_conn and self.serial_conn.is_open:
                 self.serial_conn.close()
             self.is_connected = False
-            logging.info(f"Disconnected from {self.port}")
+            _log.info(f"Disconnected from {self.port}")
             return True
         except Exception as e:
-            logging.error(f"Error disconnecting: {e}")
+            _log.error("Error disconnecting: %s", e)
             return False
     
-    async def send_command(self, command: str) -> Optional[str]:
-        """Send command and receive response."""
+    def _check_connected(self):
         if not self.is_connected or not self.serial_conn:
             raise ConnectionError("Not connected to device")
+    
+    def _blocking_send(self, frames: list) -> list:
+        """Write frames and read their responses (runs in a worker thread)."""
+        responses = []
+        command_ids = [_frame_id(frame) for frame in frames]
+        
+        # Anything still held under a reused ID is a stale reply
+        for command_id in command_ids:
+            self._pending.pop(command_id, None)
         
         try:
-            # Clear input buffer
-            self.serial_conn.reset_input_buffer()
+            # Normally every received byte is accounted for by _rx/_pending, so the
+            # input is only flushed (one tcflush) when that can no longer be trusted
+            if self._rx_dirty:
+                self.serial_conn.reset_input_buffer()
+                self._rx.clear()
+                self._pending.clear()
+                self._rx_dirty = False
             
-            # Send command as ASCII string with newline
-            command_bytes = (command + '\r\n').encode('ascii')
-            self.serial_conn.write(command_bytes)
-            logging.debug(f"Sent: {command}")
+            # Send all frames in one write
+            self.serial_conn.write(b"".join(frames))
+            debug = _log.isEnabledFor(logging.DEBUG)
+            if debug:
+                for frame in frames:
+                    _log.debug("Sent: %r", frame)
             
-            # Read response until newline
-            response_bytes = self.serial_conn.read_until(b'\r\n')
-            response = response_bytes.decode('ascii').strip()
-            logging.debug(f"Received: {response}")
-            
-            return response if response else None
+            # Collect the response echoing each command's ID
+            for command_id in command_ids:
+                frame = self._read_response(command_id)
+                response = frame.strip() if frame else b""
+                if debug:
+                    _log.debug("Received: %r", response)
+                responses.append(response if response else None)
             
         except Exception as e:
-            logging.error(f"Communication error: {e}")
-            return None
+            _log.error("Communication error: %s", e)
+            self._rx_dirty = True
+        
+        return responses + [None] * (len(frames) - len(responses))
+    
+    def _read_response(self, command_id: Optional[bytes]) -> Optional[bytes]:
+        """
+        Return the frame answering command_id.
+        
+        Frames carrying another ID (e.g. a late reply to a timed-out command)
+        are kept in self._pending instead of being flushed, so no valid
+        response is dropped. A frame without an ID is taken as the answer.
+        """
+        frame = self._pending.pop(command_id, None)
+        if frame is not None:
+            return frame
+        
+        while True:
+            frame = self._read_frame()
+            if frame is None:
+                return None
+            
+            frame_id = _frame_id(frame)
+            if frame_id is None or frame_id == command_id:
+                return frame
+            
+            self._pending[frame_id] = frame
+            if len(self._pending) > self.MAX_PENDING:
+                del self._pending[next(iter(self._pending))]  # Drop the oldest
+    
+    def _read_frame(self) -> Optional[bytes]:
+        """
+        Read one CR/LF-terminated frame from the persistent receive buffer.
+        
+        USB-serial adapters often deliver a frame in several pieces, so keep
+        reading whatever has arrived until the terminator is seen or the
+        response deadline passes. On timeout the partial frame stays buffered
+        and None is returned.
+        """
+        rx = self._rx
+        deadline = time.monotonic() + self.timeout
+        
+        end = rx.find(b'\r\n')
+        while end < 0:
+            if time.monotonic() >= deadline:
+                return None
+            rx += self.serial_conn.read(max(1, self.serial_conn.in_waiting))
+            end = rx.find(b'\r\n')
+        
+        frame = bytes(rx[:end + 2])
+        del rx[:end + 2]
+        return frame
 
 
-class USBInterface:
+class USBInterface(CommInterface):
     """USB communication interface for Hamilton heater shaker box."""
     
-    def __init__(self, vendor_id: int = None, product_id: int = None):
+    # Bulk IN transfer size. One transfer spans several max-size packets and
+    # completes early on a short packet, which marks the end of a response.
+    READ_SIZE = 512
+    
+    def __init__(self, vendor_id: int = None, product_id: int = None, timeout: float = 2.0):
         """
         Initialize USB interface.
         
         Args:
             vendor_id: Hamilton USB vendor ID (uses real Hamilton ID if None)
             product_id: Heater shaker product ID (uses real Hamilton ID if None)
+            timeout: Response timeout in seconds
         """
         if not USB_AVAILABLE:
             raise ImportError("pyusb is required for USB communication")
         
+        super().__init__()
+        
         # Use real Hamilton USB IDs from PyLabRobot
         self.vendor_id = vendor_id or HHSCommands.USB_VENDOR_ID
         self.product_id = product_id or HHSCommands.USB_PRODUCT_ID
+        self.timeout = timeout
         self.device = None
-        self.is_connected = False
+        self._rx_buf = usb.util.create_buffer(self.READ_SIZE)  # Reused by every bulk IN read
+        self._rx = bytearray()  # Received bytes not yet returned as a frame, kept across reads
     
     async def connect(self) -> bool:
         """Establish USB connection."""
@@ -329,7 +736,7 @@ class USBInterface:
             )
             
             if self.device is None:
-                logging.error(f"Device not found (VID:PID = {self.vendor_id:04X}:{self.product_id:04X})")
+                _log.error(f"Device not found (VID:PID = {self.vendor_id:04X}:{self.product_id:04X})")
                 return False
             
             # Set configuration
@@ -352,16 +759,16 @@ class USBInterface:
                         self.in_endpoint = ep.bEndpointAddress
             
             if not (self.out_endpoint and self.in_endpoint):
-                logging.error("Could not find bulk endpoints")
+                _log.error("Could not find bulk endpoints")
                 return False
             
             self.is_connected = True
-            logging.info(f"Connected to USB device {self.vendor_id:04X}:{self.product_id:04X}")
-            logging.info(f"Using endpoints OUT: {self.out_endpoint:02X}, IN: {self.in_endpoint:02X}")
+            _log.info(f"Connected to USB device {self.vendor_id:04X}:{self.product_id:04X}")
+            _log.info(f"Using endpoints OUT: {self.out_endpoint:02X}, IN: {self.in_endpoint:02X}")
             return True
             
         except Exception as e:
-            logging.error(f"USB connection failed: {e}")
+            _log.error("USB connection failed: %s", e)
             return False
     
     async def disconnect(self) -> bool:
@@ -370,33 +777,173 @@ class USBInterface:
             if self.device:
                 usb.util.dispose_resources(self.device)
             self.is_connected = False
-            logging.info("USB device disconnected")
+            _log.info("USB device disconnected")
             return True
         except Exception as e:
-            logging.error(f"USB disconnect error: {e}")
+            _log.error("USB disconnect error: %s", e)
             return False
     
-    async def send_command(self, command: str) -> Optional[str]:
-        """Send command via USB and receive response."""
+    def _check_connected(self):
         if not self.is_connected or not self.device:
             raise ConnectionError("Not connected to USB device")
+    
+    def _blocking_send(self, frames: list) -> list:
+        """Write frames and read their responses (runs in a worker thread)."""
+        responses = []
         
         try:
             # Use discovered endpoints instead of hard-coded values
-            command_bytes = (command + '\r\n').encode('ascii')
-            self.device.write(self.out_endpoint, command_bytes)
-            logging.debug(f"USB sent: {command}")
+            self.device.write(self.out_endpoint, b"".join(frames))
+            debug = _log.isEnabledFor(logging.DEBUG)
+            if debug:
+                for frame in frames:
+                    _log.debug("USB sent: %r", frame)
             
-            # Read response
-            response_bytes = self.device.read(self.in_endpoint, 64, timeout=2000)
-            response = bytes(response_bytes).decode('ascii').strip()
-            logging.debug(f"USB received: {response}")
-            
-            return response
+            # Read one response per command
+            for _ in frames:
+                response = self._read_frame().strip()
+                if debug:
+                    _log.debug("USB received: %r", response)
+                responses.append(response)
             
         except Exception as e:
-            logging.error(f"USB communication error: {e}")
-            return None
+            _log.error("USB communication error: %s", e)
+            self._rx.clear()  # Leftovers of a failed exchange would answer the next one
+        
+        return responses + [None] * (len(frames) - len(responses))
+    
+    def _read_frame(self) -> bytes:
+        """
+        Return one response from the persistent receive buffer.
+        
+        A response may span several bulk transfers, and one transfer may
+        carry several responses (pipelined commands), so bytes past the
+        first CR/LF stay buffered for the next call. A short transfer without
+        a terminator also ends the response; each read only gets the time
+        left until the response deadline.
+        """
+        rx = self._rx
+        deadline = time.monotonic() + self.timeout
+        
+        end = rx.find(b'\r\n')
+        while end < 0:
+            remaining_ms = int((deadline - time.monotonic()) * 1000)
+            if remaining_ms <= 0:
+                break
+            
+            try:
+                # Passing a buffer makes pyusb read into it and return the length
+                n = self.device.read(self.in_endpoint, self._rx_buf, timeout=remaining_ms)
+            except usb.core.USBError:
+                if rx:
+                    break  # Partial frame followed by silence
+                raise
+            
+            rx += memoryview(self._rx_buf)[:n]
+            end = rx.find(b'\r\n')
+            if end < 0 and n < self.READ_SIZE:
+                break
+        
+        if end < 0:
+            frame = bytes(rx)
+            rx.clear()
+            return frame
+        
+        frame = bytes(rx[:end + 2])
+        del rx[:end + 2]
+        return frame
+
+
+# Event loop shared by the synchronous wrappers of every HeaterShaker; it runs
+# forever in a daemon thread so devices can be driven from any thread
+_worker_loop = None
+_worker_lock = threading.Lock()
+
+
+def _ensure_worker_loop() -> asyncio.AbstractEventLoop:
+    """Start the shared worker loop on first use and return it."""
+    global _worker_loop
+    
+    with _worker_lock:
+        if _worker_loop is None:
+            _worker_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_worker_loop.run_forever,
+                name="HeaterShakerLoop",
+                daemon=True
+            ).start()
+        return _worker_loop
+
+
+class CommandPipeline:
+    """
+    Queue HHS commands and send them to the device in a single write.
+    
+    Created by HeaterShaker.pipeline(); each send() returns a future that
+    resolves to the parsed response once the block exits. Responses are
+    matched to commands by their echoed command ID. On a device created
+    with pipelining=False the commands are sent one exchange at a time.
+    
+    Usage:
+        async with hs.pipeline() as p:
+            lock = p.send("LP", lp=1)
+            status = p.send("RD")
+        if (await lock).success: ...
+    """
+    
+    def __init__(self, heater_shaker: "HeaterShaker"):
+        self._heater_shaker = heater_shaker
+        self._queued = []  # (command_id, command_frame, future)
+    
+    def send(self, command: str, **kwargs) -> asyncio.Future:
+        """Queue a command; returns a future for its parsed response."""
+        if not self._heater_shaker.is_connected:
+            raise RuntimeError("Device not connected")
+        
+        cmd_id, frame = self._heater_shaker._next_frame(command, **kwargs)
+        future = asyncio.get_running_loop().create_future()
+        self._queued.append((cmd_id, frame, future))
+        return future
+    
+    async def __aenter__(self) -> "CommandPipeline":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        queued, self._queued = self._queued, []
+        
+        if exc_type is not None:
+            for _, _, future in queued:
+                future.cancel()
+            return False
+        
+        if not queued:
+            return False
+        
+        comm_interface = self._heater_shaker.comm_interface
+        if self._heater_shaker._supports_pipelining:
+            responses = await comm_interface.send_frames([frame for _, frame, _ in queued])
+        else:
+            # One command per exchange, each answered before the next is written
+            responses = [(await comm_interface.send_frames([frame]))[0] for _, frame, _ in queued]
+        
+        # Demultiplex by echoed command ID; unmatched responses fill in order
+        pending = {_ID_BYTES[cmd_id]: future for cmd_id, _, future in queued}
+        unmatched = []
+        for response in responses:
+            parsed = HHSCommands.parse_response(response or b"")
+            future = pending.pop(parsed.command_id, None)
+            if future is not None:
+                future.set_result(parsed)
+            else:
+                unmatched.append(parsed)
+        
+        for future, parsed in zip(list(pending.values()), unmatched):
+            future.set_result(parsed)
+        for future in pending.values():
+            if not future.done():
+                future.set_result(HHSCommands.parse_response(b""))
+        
+        return False
 
 
 class HeaterShaker:
@@ -405,13 +952,57 @@ class HeaterShaker:
     
     This class provides direct communication with Hamilton heater shakers
     without PyLabRobot dependencies.
+    
+    The timing tunables below (TEMP_TTL, MONITOR_*, WAIT_POLL_*) are class
+    attributes and, because of __slots__, can only be changed on the class
+    or a subclass, not on an instance:
+    
+        HeaterShaker.MONITOR_INTERVAL = 1.0      # every device
+        
+        class FastHHS(HeaterShaker):             # per device type
+            MONITOR_INTERVAL = 1.0
     """
     
+    # Fixed attribute set: no per-instance __dict__, and faster attribute
+    # access in the polling loops
+    __slots__ = (
+        'port', 'interface', '_interface_type', '_supports_pipelining', 'device_index', 'name',
+        'comm_interface', 'is_initialized', 'is_connected',
+        'max_temperature', 'min_temperature', 'max_speed', 'min_speed',
+        'min_acceleration', 'max_acceleration',
+        'current_temperature', 'current_speed', 'is_shaking',
+        '_command_id', '_temp_cache', '_state_cache', '_state_ttl', '_prepared',
+        '_fixed', '_ta_frame', '_ta_slots', '_sb_frame', '_sb_slots',
+        '_frame_lock', '_repr_prefix', 'logger',
+    )
+    
+    # Timing tunables; set on the class or a subclass (instances are slotted)
+    # Seconds an RT reading is reused before the device is queried again
+    TEMP_TTL = 0.05
+    # Seconds between status checks while heat_shake runs
+    MONITOR_INTERVAL = 10.0
+    # Consecutive failed status reads after which heat_shake gives up on the device
+    MONITOR_MAX_FAILURES = 3
+    # °C the middle temperature may drift from the setpoint while shaking before a warning
+    MONITOR_TEMP_TOLERANCE = 2.0
+    # Bounds (seconds) of the temperature poll interval in _wait_for_temperature
+    WAIT_POLL_MIN = 0.2
+    WAIT_POLL_MAX = 5.0
+    # Open transports keyed by (interface, port), shared by all device indices on them
+    _transport_pool = {}
+    # Last list_available_ports() scan and how long (seconds) it is reused
+    _ports_cache = None
+    _ports_cache_ts = 0.0
+    _ports_cache_ttl = 1.0
+    _comports = None  # serial.tools.list_ports.comports, imported on first use
+    
     def __init__(self, 
                  port: str = "COM3",  # Default port
                  interface: Literal["rs232", "usb"] = "rs232",
                  device_index: int = 1,
-                 name: str = "Hamilton_HHS"):
+                 name: str = "Hamilton_HHS",
+                 state_ttl: float = 0.2,
+                 pipelining: bool = True):
         """
         Initialize HeaterShaker controller.
         
@@ -420,12 +1011,25 @@ class HeaterShaker:
             interface: Communication interface type ("rs232" or "usb")
             device_index: Device index for multi-device setups
             name: Device name identifier
+            state_ttl: Seconds a QC/QE/QD query result is reused before
+                the device is asked again (0 disables the cache)
+            pipelining: Send several id-tagged commands in one write (both
+                the box and the STAR queue them); set False for firmware
+                that needs one command at a time
         """
         self.port = port
         self.interface = InterfaceType(interface)
+        self._interface_type = self.interface.value  # "usb" or "rs232", as build_command_bytes takes it
+        self._supports_pipelining = pipelining
         self.device_index = device_index
         self.name = name
         
+        # A port missing from the last scan may just have been plugged in
+        cached = HeaterShaker._ports_cache
+        if cached is not None and self.interface == InterfaceType.RS232 and \
+                not any(p.device == port for p in cached):
+            HeaterShaker._ports_cache = None
+        
         # Communication interface
         self.comm_interface = None
         self.is_initialized = False
@@ -444,25 +1048,28 @@ class HeaterShaker:
         self.current_speed = None
         self.is_shaking = False
         self._command_id = 0  # Command ID counter
+        self._frame_lock = threading.Lock()  # Guards the ID counter and frame templates across threads
+        self._temp_cache = (0.0, None, None)  # (monotonic time, middle, edge) of last RT reading
+        self._state_cache = {}  # Query command (QC/QE/QD) -> (monotonic time, parsed result)
+        self._state_ttl = state_ttl
+        self._prepared = {}  # (temperature, speed, acceleration) -> validated (ta, sv, sr) fields
+        self._init_frame_templates()
         
-        # Setup logging
-        logging.basicConfig(level=logging.INFO)
-        self.logger = logging.getLogger(__name__)
+        # Only the status part of __repr__ changes after construction
+        self._repr_prefix = f"HeaterShaker(name='{self.name}', interface='{self.interface.value}', port='{self.port}', status="
         
-        # Event loop for synchronous operations
-        self._loop = None
+        # Logging (handlers/levels are configured by the application)
+        self.logger = _log
     
     def _run_async(self, coro):
-        """Run async function synchronously."""
-        if self._loop is None:
-            self._loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self._loop)
-        return self._loop.run_until_complete(coro)
+        """Run async function synchronously on the shared worker loop."""
+        loop = _ensure_worker_loop()
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
     
     # Synchronous wrapper methods for compatibility
-    def initialize(self, temp: float = 25.0) -> bool:
+    def initialize(self, temp: float = 25.0, protocol: Optional[tuple] = None) -> bool:
         """Synchronous wrapper for initialize."""
-        return self._run_async(self.initialize_async(temperature=temp))
+        return self._run_async(self.initialize_async(temperature=temp, protocol=protocol))
     
     def heat_shake(self, time: float, temperature: float, speed: float, **kwargs) -> bool:
         """Synchronous wrapper for heat_shake."""
@@ -473,8 +1080,8 @@ class HeaterShaker:
         return self._run_async(self.set_temperature_async(temperature))
     
     def get_temperature(self) -> Optional[float]:
-        """Synchronous wrapper for get_temperature."""
-        return self._run_async(self.get_temperature_async())
+        """Synchronous get_temperature; a single blocking RT exchange, no event loop hop."""
+        return self._read_temps_sync()[0]
     
     def start_shaking(self, speed: float = 800, **kwargs) -> bool:
         """Synchronous wrapper for start_shaking."""
@@ -488,6 +1095,10 @@ class HeaterShaker:
         """Synchronous wrapper for wait_for_temperature."""
         return self._run_async(self.wait_for_temperature_async())
     
+    def get_status(self) -> dict:
+        """Synchronous wrapper for get_status."""
+        return self._run_async(self.get_status_async())
+    
     def get_temperature_controller_state(self) -> Optional[dict]:
         """Synchronous wrapper for get_temperature_controller_state."""
         return self._run_async(self.get_temperature_controller_state_async())
@@ -502,20 +1113,106 @@ class HeaterShaker:
     
     def shutdown(self) -> bool:
         """Synchronous wrapper for shutdown."""
-        result = self._run_async(self.shutdown_async())
-        if self._loop:
-            self._loop.close()
-            self._loop = None
-        return result
+        return self._run_async(self.shutdown_async())
     
     def _generate_command_id(self) -> int:
-        """Generate unique command ID."""
-        self._command_id += 1
-        if self._command_id > 9999:
-            self._command_id = 1
+        """Generate unique command ID (1-9999, wrapping back to 1)."""
+        self._command_id = self._command_id % 9999 + 1
         return self._command_id
     
-    async def _send_hhs_command(self, command: str, **kwargs) -> dict:
+    def _next_frame(self, command: str, **kwargs) -> tuple:
+        """
+        Take the next command ID and build its frame: (cmd_id, frame).
+        
+        Locked because the synchronous get_temperature runs this on the
+        caller's thread while the worker loop may be building another frame
+        in the same shared templates.
+        """
+        with self._frame_lock:
+            cmd_id = self._generate_command_id()
+            return cmd_id, self._build_frame(command, cmd_id, **kwargs)
+    
+    def _build_frame(self, command: str, cmd_id: int, **kwargs) -> bytes:
+        """
+        Build the encoded command frame for this device.
+        
+        TA and SB reuse per-instance byte templates: only the ID and argument
+        digits are overwritten, skipping string formatting and encoding (TA
+        also takes its digits pre-encoded, see format_temperature_bytes).
+        Arguments that do not fit the template widths use the generic path.
+        The zero-argument polling commands (RT, RD, SC, SW, LI, SI) are
+        pre-encoded the same way and only get their ID digits replaced.
+        """
+        if not kwargs:
+            fixed = self._fixed.get(command)
+            if fixed is not None:
+                frame, id_at = fixed
+                frame[id_at:id_at + 4] = _ID_BYTES[cmd_id]
+                return bytes(frame)
+        
+        elif command == HHSCommands.SET_TEMPERATURE and len(kwargs) == 1:
+            ta = kwargs.get('ta')
+            if isinstance(ta, bytes):
+                if len(ta) == 4:
+                    frame, (id_at, ta_at) = self._ta_frame, self._ta_slots
+                    frame[id_at:id_at + 4] = _ID_BYTES[cmd_id]
+                    frame[ta_at:ta_at + 4] = ta
+                    return bytes(frame)  # Copy: the template is reused by the next command
+                kwargs = {'ta': ta.decode('ascii')}
+            elif isinstance(ta, str) and len(ta) == 4:
+                frame, (id_at, ta_at) = self._ta_frame, self._ta_slots
+                frame[id_at:id_at + 4] = _ID_BYTES[cmd_id]
+                frame[ta_at:ta_at + 4] = ta.encode('ascii')
+                return bytes(frame)
+        
+        elif command == HHSCommands.START_SHAKING and len(kwargs) == 3:
+            st, sv, sr = kwargs.get('st'), kwargs.get('sv'), kwargs.get('sr')
+            if st in (0, 1) and isinstance(sv, str) and len(sv) == 4 and isinstance(sr, str) and len(sr) == 5:
+                frame, (id_at, st_at, sv_at, sr_at) = self._sb_frame, self._sb_slots
+                frame[id_at:id_at + 4] = _ID_BYTES[cmd_id]
+                frame[st_at:st_at + 1] = b'1' if st else b'0'
+                frame[sv_at:sv_at + 4] = sv.encode('ascii')
+                frame[sr_at:sr_at + 5] = sr.encode('ascii')
+                return bytes(frame)
+        
+        return HHSCommands.build_command_bytes(self.device_index, command, cmd_id, self._interface_type, **kwargs)
+    
+    def _init_frame_templates(self):
+        """Prepare the byte templates and the offsets of their variable fields."""
+        def template(command: str, **kwargs) -> bytearray:
+            return bytearray(HHSCommands.build_command(
+                self.device_index, command, 0, self._interface_type, **kwargs
+            ).encode('ascii') + b'\r\n')
+        
+        self._fixed = {}
+        for command in (HHSCommands.GET_TEMPERATURE, HHSCommands.GET_SHAKING_STATUS,
+                        HHSCommands.STOP_SHAKING, HHSCommands.WAIT_FOR_STOP,
+                        HHSCommands.INITIALIZE_LOCK, HHSCommands.INITIALIZE_SHAKER):
+            frame = template(command)
+            self._fixed[command] = (frame, frame.find(b'id') + 2)
+        
+        ta = template(HHSCommands.SET_TEMPERATURE, ta="0000")
+        id_at = ta.find(b'id') + 2
+        self._ta_frame = ta
+        self._ta_slots = (id_at, ta.find(b'ta', id_at) + 2)
+        
+        sb = template(HHSCommands.START_SHAKING, st=0, sv="0000", sr="00000")
+        id_at = sb.find(b'id') + 2
+        st_at = sb.find(b'st', id_at) + 2
+        sv_at = sb.find(b'sv', st_at) + 2
+        self._sb_frame = sb
+        self._sb_slots = (id_at, st_at, sv_at, sb.find(b'sr', sv_at) + 2)
+    
+    def pipeline(self) -> CommandPipeline:
+        """
+        Batch several commands into one write/read round trip.
+        
+        Returns:
+            Async context manager; see CommandPipeline
+        """
+        return CommandPipeline(self)
+    
+    async def _send_hhs_command(self, command: str, **kwargs) -> HHSReply:
         """
         Send Hamilton HHS command and parse response.
         
@@ -524,33 +1221,41 @@ class HeaterShaker:
             **kwargs: Command arguments
             
         Returns:
-            Parsed response dictionary
+            Parsed HHSReply
         """
+        response = await self._send_hhs_command_raw(command, **kwargs)
+        
+        # Parse response
+        return HHSCommands.parse_response(response or b"")
+    
+    async def _send_hhs_command_raw(self, command: str, **kwargs) -> Optional[bytes]:
+        """Send Hamilton HHS command and return the unparsed response frame."""
         if not self.is_connected:
             raise RuntimeError("Device not connected")
         
-        # Build command string with proper addressing
-        cmd_id = self._generate_command_id()
-        cmd_str = HHSCommands.build_command(
-            index=self.device_index,
-            command=command,
-            command_id=cmd_id,
-            interface_type=self.interface.value,  # "usb" or "rs232"
-            **kwargs
-        )
+        _, frame = self._next_frame(command, **kwargs)
         
-        # Send command
-        response = await self.comm_interface.send_command(cmd_str)
+        return await self.comm_interface.send_command_bytes(frame)
+    
+    def _send_hhs_command_sync(self, command: str, **kwargs) -> HHSReply:
+        """Send Hamilton HHS command from the calling thread, bypassing the event loop."""
+        if not self.is_connected:
+            raise RuntimeError("Device not connected")
         
-        # Parse response
-        return HHSCommands.parse_response(response or "")
+        _, frame = self._next_frame(command, **kwargs)
+        
+        response = self.comm_interface.send_frames_sync([frame])[0]
+        return HHSCommands.parse_response(response or b"")
     
-    async def initialize_async(self, temperature: float = 25.0) -> bool:
+    async def initialize_async(self, temperature: float = 25.0, protocol: Optional[tuple] = None) -> bool:
         """
         Initialize the heater shaker and set initial temperature.
         
         Args:
             temperature: Initial target temperature in Celsius
+            protocol: Optional (temperature, speed, acceleration) that later
+                heat_shake calls will repeat; it is validated and formatted
+                once here, so those calls skip both steps
             
         Returns:
             bool: True if initialization successful
@@ -560,17 +1265,25 @@ class HeaterShaker:
             if not (self.min_temperature <= temperature <= self.max_temperature):
                 raise ValueError(f"Temperature must be between {self.min_temperature}°C and {self.max_temperature}°C")
             
-            # Setup communication interface
-            if self.interface == InterfaceType.RS232:
-                self.comm_interface = SerialInterface(self.port)
-            elif self.interface == InterfaceType.USB:
-                self.comm_interface = USBInterface()
-            else:
-                raise ValueError(f"Unsupported interface: {self.interface}")
+            if protocol is not None:
+                self._prepare_protocol(*protocol)
+            
+            # Setup communication interface, shared by all devices on the same port
+            key = self._transport_key()
+            transport = self._transport_pool.get(key)
+            if transport is None:
+                if self.interface == InterfaceType.RS232:
+                    transport = SerialInterface(self.port)
+                elif self.interface == InterfaceType.USB:
+                    transport = USBInterface()
+                else:
+                    raise ValueError(f"Unsupported interface: {self.interface}")
+                self._transport_pool[key] = transport
             
-            # Connect to device
-            if not await self.comm_interface.connect():
+            # Connect to device (no-op if another device already opened it)
+            if not await transport.acquire():
                 raise ConnectionError("Failed to connect to device")
+            self.comm_interface = transport
             
             self.is_connected = True  # Set connected state before sending commands
             
@@ -590,11 +1303,30 @@ class HeaterShaker:
             return True
             
         except Exception as e:
-            self.logger.error(f"Initialization failed: {e}")
+            self.logger.error("Initialization failed: %s", e)
+            if self.is_connected:
+                await self._release_transport()
             self.is_initialized = False
             self.is_connected = False
             return False
     
+    def _transport_key(self) -> tuple:
+        """Pool key of the transport this device talks through."""
+        if self.interface == InterfaceType.USB:
+            return (self.interface.value, None)  # One Hamilton box per host
+        return (self.interface.value, self.port)
+    
+    async def _release_transport(self):
+        """Release the shared transport; the last device disconnects it."""
+        transport = self.comm_interface
+        if transport is None:
+            return
+        await transport.release()
+        if not transport.is_connected:
+            key = self._transport_key()
+            if self._transport_pool.get(key) is transport:
+                del self._transport_pool[key]
+    
     async def heat_shake_async(self, 
                         time: float, 
                         temperature: float, 
@@ -619,10 +1351,11 @@ class HeaterShaker:
         if not self.is_initialized:
             raise RuntimeError("Device not initialized")
         
-        # Validate parameters
-        self._validate_temperature(temperature)
-        self._validate_speed(speed)
-        self._validate_acceleration(acceleration)
+        # Validate and format parameters, unless prepared by initialize
+        fields = self._prepared.get((temperature, speed, acceleration))
+        if fields is None:
+            fields = self._format_protocol(temperature, speed, acceleration)
+        ta, sv, sr = fields
         
         if time <= 0:
             raise ValueError("Time must be positive")
@@ -632,26 +1365,38 @@ class HeaterShaker:
         try:
             self.logger.info(f"Starting heat-shake: {temperature}°C, {speed} steps/sec, direction {direction}")
             
-            # Set temperature
-            if not await self.set_temperature_async(temperature):
-                return False
-            
-            # Wait for temperature if requested
-            if wait_for_temperature:
-                if not await self._wait_for_temperature(temperature):
-                    self.logger.warning("Temperature stabilization timeout")
-            
-            # Lock plate (required for shaking)
-            if not await self.lock_plate():
-                return False
+            # _start_shaking locks the plate (required for shaking) and sends SB
+            # only once the lock succeeded
+            if wait_for_temperature or not self._supports_pipelining:
+                # Set temperature
+                if not await self._set_temperature(temperature, ta):
+                    return False
+                
+                # Wait for temperature if requested
+                if wait_for_temperature:
+                    if not await self._wait_for_temperature(temperature):
+                        self.logger.warning("Temperature stabilization timeout")
+                
+                # Start shaking with specified parameters
+                if not await self._start_shaking(speed, direction, sv, sr):
+                    await self.stop_shaking_async()  # Safety stop
+                    return False
+            else:
+                # Nothing to wait for in between: the transport coalesces the
+                # concurrent TA and LP commands into one write (SB/RD follow)
+                temp_ok, shake_ok = await asyncio.gather(
+                    self._set_temperature(temperature, ta),
+                    self._start_shaking(speed, direction, sv, sr)
+                )
+                if not (shake_ok and temp_ok):
+                    await self.stop_shaking_async()  # Safety stop
+                    return False
             
-            # Start shaking with specified parameters
-            if not await self.start_shaking_async(speed=speed, direction=direction, acceleration=acceleration):
+            # Run for specified time, checking shaking and temperature along the way
+            if not await self._monitor_shaking(time, temperature):
+                await self.stop_shaking_async()  # Safety stop
                 return False
             
-            # Run for specified time
-            await asyncio.sleep(time)
-            
             # Stop shaking
             await self.stop_shaking_async()
             
@@ -659,61 +1404,160 @@ class HeaterShaker:
             return True
             
         except Exception as e:
-            self.logger.error(f"Heat-shake failed: {e}")
+            self.logger.error("Heat-shake failed: %s", e)
             await self.stop_shaking_async()  # Safety stop
             return False
     
+    async def _monitor_shaking(self, duration: float, target_temp: float) -> bool:
+        """
+        Wait for duration seconds while the device shakes.
+        
+        Every MONITOR_INTERVAL seconds the shaking status and temperature are
+        read in one pipelined round trip (get_status_async), so a device that
+        stopped on its own (e.g. a drive or lock fault) ends the wait early.
+        A lost reply is not taken as a stop; only MONITOR_MAX_FAILURES failed
+        reads in a row end the wait. Once the middle temperature has reached
+        target_temp, drifting more than MONITOR_TEMP_TOLERANCE away from it
+        is logged as a warning.
+        
+        Returns:
+            bool: False if the device stopped shaking (or stopped answering)
+            before the deadline
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + duration
+        failures = 0
+        reached = False
+        
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return True
+            
+            await asyncio.sleep(min(remaining, self.MONITOR_INTERVAL))
+            
+            status = await self.get_status_async()
+            if status['is_shaking'] is False:
+                self.logger.error("Device stopped shaking before the protocol finished")
+                return False
+            
+            middle = status['middle_temp']
+            if status['is_shaking'] is None or middle is None:
+                failures += 1
+                if failures >= self.MONITOR_MAX_FAILURES:
+                    self.logger.error("No status from the device in %d consecutive reads", failures)
+                    return False
+                continue
+            failures = 0
+            
+            if abs(middle - target_temp) <= self.MONITOR_TEMP_TOLERANCE:
+                reached = True
+            elif reached:
+                self.logger.warning("Temperature drifted to %.1f°C while shaking (target %.1f°C)",
+                                    middle, target_temp)
+    
     async def set_temperature_async(self, temperature: float) -> bool:
         """Set heater temperature."""
         self._validate_temperature(temperature)
         
-        # Format temperature according to Hamilton protocol (temp * 10 as 4-digit string)
-        temp_str = HHSCommands.format_temperature(temperature)
-        
+        # Format temperature according to Hamilton protocol (temp * 10 as 4 digits),
+        # pre-encoded so it drops straight into the TA frame template
+        return await self._set_temperature(temperature, HHSCommands.format_temperature_bytes(temperature))
+    
+    async def _set_temperature(self, temperature: float, temp_bytes: bytes) -> bool:
+        """Send TA with an already validated and formatted temperature."""
+        self._invalidate_state()
         response = await self._send_hhs_command(
             HHSCommands.SET_TEMPERATURE, 
-            ta=temp_str  # Hamilton uses 'ta' parameter
+            ta=temp_bytes  # Hamilton uses 'ta' parameter
         )
         
-        if response['success']:
+        if response.success:
             self.logger.info(f"Temperature set to {temperature}°C")
             return True
         
-        self.logger.error(f"Failed to set temperature: {response.get('error', 'Unknown error')}")
+        self.logger.error(f"Failed to set temperature: {response.error or 'Unknown error'}")
         return False
     
-    async def get_temperature_async(self) -> Optional[float]:
-        """Get current middle temperature reading."""
-        response = await self._send_hhs_command(HHSCommands.GET_TEMPERATURE)
+    async def _read_temps(self) -> tuple:
+        """
+        Read middle and edge temperatures with one RT command.
+        
+        A reading younger than TEMP_TTL is reused, so callers asking for
+        both values (or polling back to back) cost a single round trip.
         
-        if response['success']:
+        Returns:
+            (middle, edge) in Celsius; (None, None) if the read failed
+        """
+        cached = self._cached_temps()
+        if cached is not None:
+            return cached
+        return self._store_temps(await self._send_hhs_command(HHSCommands.GET_TEMPERATURE))
+    
+    def _read_temps_sync(self) -> tuple:
+        """Blocking counterpart of _read_temps for the synchronous API."""
+        cached = self._cached_temps()
+        if cached is not None:
+            return cached
+        return self._store_temps(self._send_hhs_command_sync(HHSCommands.GET_TEMPERATURE))
+    
+    def _cached_temps(self) -> Optional[tuple]:
+        """(middle, edge) of the last RT reading if it is younger than TEMP_TTL."""
+        cached_at, middle, edge = self._temp_cache
+        if middle is not None and time.monotonic() - cached_at < self.TEMP_TTL:
+            return middle, edge
+        return None
+    
+    def _store_temps(self, response: HHSReply) -> tuple:
+        """Parse an RT reply and update the temperature cache."""
+        if response.success:
             # Parse Hamilton temperature response
-            temp_data = HHSCommands.parse_temperature_response(response['raw_response'])
+            temp_data = HHSCommands.parse_temperature_response(response.raw)
             
-            if temp_data['success'] and temp_data['middle'] is not None:
-                temperature = temp_data['middle']
-                self.current_temperature = temperature
-                return temperature
+            if temp_data['success']:
+                middle, edge = temp_data['middle'], temp_data['edge']
+                self._temp_cache = (time.monotonic(), middle, edge)
+                self.current_temperature = middle
+                return middle, edge
+        
+        self.logger.error(f"Failed to get temperature: {response.error or 'Unknown error'}")
+        return None, None
+    
+    def _cached_state(self, command: str):
+        """(True, result) of the last command query if younger than state_ttl, else (False, None)."""
+        cached = self._state_cache.get(command)
+        if cached is not None and time.monotonic() - cached[0] < self._state_ttl:
+            return True, cached[1]
+        return False, None
+    
+    def _invalidate_state(self):
+        """Drop cached controller queries after a command that changes the device state."""
+        self._state_cache.clear()
+    
+    async def get_temperature_async(self) -> Optional[float]:
+        """Get current middle temperature reading."""
+        middle, _ = await self._read_temps()
+        return middle
+    
+    async def get_temperatures_async(self) -> tuple:
+        """
+        Get middle and edge temperature readings from a single RT command.
         
-        self.logger.error(f"Failed to get temperature: {response.get('error', 'Unknown error')}")
-        return None
+        Returns:
+            (middle, edge) in Celsius; (None, None) if the read failed
+        """
+        return await self._read_temps()
     
     async def get_edge_temperature(self) -> Optional[float]:
         """Get current edge temperature reading."""
-        response = await self._send_hhs_command(HHSCommands.GET_TEMPERATURE)
-        
-        if response['success']:
-            temp_data = HHSCommands.parse_temperature_response(response['raw_response'])
-            
-            if temp_data['success'] and temp_data['edge'] is not None:
-                return temp_data['edge']
-        
-        return None
+        _, edge = await self._read_temps()
+        return edge
     
     async def start_shaking_async(self, 
                            speed: float = 800,
                            direction: int = 0,
-                           acceleration: int = 1000) -> bool:
+                           acceleration: int = 1000,
+                           verify: bool = True) -> bool:
         """
         Start shaking with specified parameters.
         
@@ -721,6 +1565,8 @@ class HeaterShaker:
             speed: Speed in steps/second (20-2000)
             direction: Direction (0=positive, 1=negative)
             acceleration: Acceleration in increments/second (500-10000)
+            verify: Check the shaking status (RD) after starting; set False
+                to skip the status frame when the caller monitors it anyway
         """
         self._validate_speed(speed)
         self._validate_acceleration(acceleration)
@@ -732,22 +1578,31 @@ class HeaterShaker:
         speed_str = HHSCommands.format_speed(int(speed))
         accel_str = HHSCommands.format_acceleration(acceleration)
         
-        # First ensure plate is locked
+        return await self._start_shaking(speed, direction, speed_str, accel_str, verify)
+    
+    async def _start_shaking(self, speed: float, direction: int, speed_str: str, accel_str: str,
+                             verify: bool = True) -> bool:
+        """Lock the plate and send SB with already validated and formatted parameters."""
+        # Plate must be locked before shaking, so SB is only sent once LP succeeded
         if not await self.lock_plate():
             self.logger.error("Failed to lock plate - cannot start shaking")
             return False
         
-        # Start shaking with Hamilton SB command
-        response = await self._send_hhs_command(
-            HHSCommands.START_SHAKING,
-            st=direction,      # direction
-            sv=speed_str,      # speed (4-digit)
-            sr=accel_str       # acceleration (5-digit)
-        )
+        # Start shaking and verify in one round trip
+        async with self.pipeline() as p:
+            start = p.send(
+                HHSCommands.START_SHAKING,
+                st=direction,      # direction
+                sv=speed_str,      # speed (4-digit)
+                sr=accel_str       # acceleration (5-digit)
+            )
+            status = p.send(HHSCommands.GET_SHAKING_STATUS) if verify else None
         
-        if response['success']:
+        response = await start
+        if response.success:
             # Verify shaking started
-            if await self.get_is_shaking():
+            status = await status if verify else None
+            if not verify or (status.success and HHSCommands.parse_shaking_response(status.raw)):
                 self.is_shaking = True
                 self.current_speed = speed
                 self.logger.info(f"Shaking started: {speed} steps/sec, direction {direction}")
@@ -756,42 +1611,61 @@ class HeaterShaker:
                 self.logger.error("Shaking command sent but device not shaking")
                 return False
         
-        self.logger.error(f"Failed to start shaking: {response.get('error', 'Unknown error')}")
+        self.logger.error(f"Failed to start shaking: {response.error or 'Unknown error'}")
         return False
     
     async def stop_shaking_async(self) -> bool:
         """Stop shaking."""
-        # Send stop command
-        response = await self._send_hhs_command(HHSCommands.STOP_SHAKING)
+        # Send stop and wait-for-stop in one write; SW answers once the drive is still
+        async with self.pipeline() as p:
+            stop = p.send(HHSCommands.STOP_SHAKING)
+            p.send(HHSCommands.WAIT_FOR_STOP)
         
-        if response['success']:
-            # Wait for stop to complete
-            await self._send_hhs_command(HHSCommands.WAIT_FOR_STOP)
-            
+        response = await stop
+        if response.success:
             self.is_shaking = False
             self.logger.info("Shaking stopped")
             return True
         
-        self.logger.error(f"Failed to stop shaking: {response.get('error', 'Unknown error')}")
+        self.logger.error(f"Failed to stop shaking: {response.error or 'Unknown error'}")
         return False
     
     async def get_is_shaking(self) -> bool:
         """Check if device is currently shaking."""
-        response = await self._send_hhs_command(HHSCommands.GET_SHAKING_STATUS)
-        
-        if response['success']:
-            return HHSCommands.parse_shaking_response(response['raw_response'])
+        # Only an rd1 status means shaking, so the raw frame is checked directly
+        # without building a parsed reply
+        raw = await self._send_hhs_command_raw(HHSCommands.GET_SHAKING_STATUS)
+        return raw is not None and b'rd1' in raw
+    
+    async def get_status_async(self) -> dict:
+        """
+        Read temperatures and shaking status in one round trip (RT + RD pipelined).
         
-        return False
+        Returns:
+            dict with 'middle_temp', 'edge_temp' (None if the read failed)
+            and 'is_shaking' (None if the RD reply failed)
+        """
+        async with self.pipeline() as p:
+            temp_status = p.send(HHSCommands.GET_TEMPERATURE)
+            shake_status = p.send(HHSCommands.GET_SHAKING_STATUS)
+        
+        middle, edge = self._store_temps(await temp_status)
+        shake_status = await shake_status
+        return {
+            'middle_temp': middle,
+            'edge_temp': edge,
+            'is_shaking': HHSCommands.parse_shaking_response(shake_status.raw) if shake_status.success else None
+        }
     
     async def lock_plate(self) -> bool:
         """Lock the plate for shaking."""
+        self._invalidate_state()
         response = await self._send_hhs_command(
             HHSCommands.LOCK_PLATE,
             lp=1  # 1 = locked
         )
         
-        if response['success']:
+        if response.success:
             self.logger.info("Plate locked")
             return True
         
@@ -800,12 +1674,13 @@ class HeaterShaker:
     
     async def unlock_plate(self) -> bool:
         """Unlock the plate."""
+        self._invalidate_state()
         response = await self._send_hhs_command(
             HHSCommands.LOCK_PLATE,
             lp=0  # 0 = unlocked
         )
         
-        if response['success']:
+        if response.success:
             self.logger.info("Plate unlocked")
             return True
         
@@ -816,23 +1691,17 @@ class HeaterShaker:
         """Wait until target temperature is reached (TW command)."""
         response = await self._send_hhs_command("TW")
         
-        if response['success']:
+        if response.success:
             self.logger.info("Temperature target reached")
             return True
+        
+        # Handle specific temperature errors from manual
+        message = _TEMP_ERRORS.get(response.error_code)
+        if message:
+            self.logger.error(message)
         else:
-            # Handle specific temperature errors from manual
-            error_code = response.get('error_code', 'Unknown')
-            if error_code == "61":
-                self.logger.error("Temperature timeout - target not reached in time")
-            elif error_code == "62":
-                self.logger.error("Temperature out of supervision range")
-            elif error_code == "63":
-                self.logger.error("Temperature out of security range - heating disabled")
-            elif error_code == "64":
-                self.logger.error("Temperature sensor error - no connection to sensors or sensor difference too big")
-            else:
-                self.logger.error(f"Temperature wait failed: {response.get('error', 'Unknown error')}")
-            return False
+            self.logger.error(f"Temperature wait failed: {response.error or 'Unknown error'}")
+        return False
     
     async def start_temperature_with_wait(self, temperature: float, **kwargs) -> bool:
         """Start temperature controller and wait for target (TB command)."""
@@ -840,78 +1709,93 @@ class HeaterShaker:
         
         temp_str = HHSCommands.format_temperature(temperature)
         
+        self._invalidate_state()
         response = await self._send_hhs_command(
             "TB",  # Start temperature with wait
             ta=temp_str,
             **kwargs
         )
         
-        if response['success']:
+        if response.success:
             self.logger.info(f"Temperature reached {temperature}°C")
             return True
+        
+        message = _TEMP_ERRORS.get(response.error_code)
+        if message:
+            self.logger.error(message)
         else:
-            error_code = response.get('error_code', 'Unknown')
-            if error_code == "61":
-                self.logger.error("Temperature timeout during startup")
-            elif error_code == "62":
-                self.logger.error("Temperature supervision failed")
-            elif error_code == "63":
-                self.logger.error("Temperature security range violation")
-            elif error_code == "64":
-                self.logger.error("Temperature sensor error - no connection to sensors or sensor difference too big")
-            else:
-                self.logger.error(f"Temperature control failed: {response.get('error', 'Unknown error')}")
-            return False
+            self.logger.error(f"Temperature control failed: {response.error or 'Unknown error'}")
+        return False
     
     async def get_temperature_controller_state_async(self) -> Optional[dict]:
-        """Get temperature controller state (QC command)."""
+        """Get temperature controller state (QC command, cached for state_ttl)."""
+        hit, state = self._cached_state("QC")
+        if hit:
+            return state
+        
         response = await self._send_hhs_command("QC")
         
-        if response['success']:
-            try:
-                # Parse QC response: look for 'qc' token followed by three values
-                # Format: ...er00qc1 128 0 (control_state pwm_value supervision_state)
-                if 'qc' in response['raw_response']:
-                    qc_part = response['raw_response'].split('qc')[1]
-                    parts = qc_part.split()
-                    
-                    if len(parts) >= 3:
-                        return {
-                            'control_active': parts[0] == '1',
-                            'pwm_value': int(parts[1]),
-                            'supervision_state': int(parts[2])
-                        }
-            except Exception as e:
-                self.logger.error(f"Error parsing controller state: {e}")
+        if response.success:
+            # Format: ...er00qc1 128 0 (control_state pwm_value supervision_state).
+            # One find for the tag, then at most three fields are split off after it.
+            raw = response.raw
+            qc_at = raw.find(b'qc')
+            fields = raw[qc_at + 2:].split(None, 3) if qc_at >= 0 else ()
+            if len(fields) >= 3 and fields[0].isdigit() and fields[1].isdigit() and fields[2].isdigit():
+                state = {
+                    'control_active': fields[0] == b'1',
+                    'pwm_value': int(fields[1]),
+                    'supervision_state': int(fields[2])
+                }
+                self._state_cache["QC"] = (time.monotonic(), state)
+                return state
+            # Frames stay bytes throughout; decode only here, for the log line
+            self.logger.error("Error parsing controller state: %s", response.raw.decode('ascii', 'replace'))
         
         return None
     
     async def get_temperature_error_async(self) -> Optional[str]:
-        """Get last temperature error code (QE command)."""
+        """Get last temperature error code (QE command, cached for state_ttl)."""
+        hit, error_code = self._cached_state("QE")
+        if hit:
+            return error_code
+        
         response = await self._send_hhs_command("QE")
         
-        if response['success']:
+        if response.success:
             # Extract error code from qe## response
-            if 'qe' in response['raw_response']:
-                error_code = response['raw_response'].split('qe')[1][:2]
+            match = _QE_RE.search(response.raw)
+            if match:
+                error_code = match.group(1).decode('ascii')
+                self._state_cache["QE"] = (time.monotonic(), error_code)
                 return error_code
         
         return None
     
     async def get_heating_state_async(self) -> Optional[bool]:
-        """Get heating up state (QD command)."""
+        """Get heating up state (QD command, cached for state_ttl)."""
+        hit, heating = self._cached_state("QD")
+        if hit:
+            return heating
+        
         response = await self._send_hhs_command("QD")
         
-        if response['success']:
-            return 'qd1' in response['raw_response']
+        if response.success:
+            # One find for the qd tag, then its status digit is compared in place
+            raw = response.raw
+            qd_at = raw.find(b'qd')
+            heating = qd_at >= 0 and raw[qd_at + 2:qd_at + 3] == b'1'
+            self._state_cache["QD"] = (time.monotonic(), heating)
+            return heating
         
         return None
     
     async def deactivate_heating(self) -> bool:
         """Turn off heating (Hamilton TO command)."""
+        self._invalidate_state()
         response = await self._send_hhs_command(HHSCommands.DEACTIVATE_HEATING)
         
-        if response['success']:
+        if response.success:
             self.logger.info("Heating deactivated")
             return True
         
@@ -920,33 +1804,103 @@ class HeaterShaker:
     async def _initialize_lock(self) -> bool:
         """Initialize the lock system (Hamilton LI command)."""
         response = await self._send_hhs_command(HHSCommands.INITIALIZE_LOCK)
-        return response['success']
+        return response.success
     
     async def _initialize_shaker(self) -> bool:
         """Initialize the shaker drive (Hamilton SI command)."""
         response = await self._send_hhs_command(HHSCommands.INITIALIZE_SHAKER)
-        return response['success']
+        return response.success
     
     async def _wait_for_temperature(self, 
                                    target_temp: float, 
                                    tolerance: float = 1.0, 
-                                   timeout: float = 300.0) -> bool:
-        """Wait for temperature to stabilize."""
-        start_time = time.time()
+                                   timeout: float = 300.0,
+                                   min_poll: Optional[float] = None,
+                                   max_poll: Optional[float] = None,
+                                   backoff_factor: float = 2.0) -> bool:
+        """
+        Wait for temperature to stabilize.
         
-        while (time.time() - start_time) < timeout:
-            current_temp = await self.get_temperature_async()
+        Polls slowly while far from the target and quickly near it
+        (interval = error * 0.5, clamped to min_poll..max_poll). While the
+        reading stays put (less than 0.1°C between samples) outside the
+        tolerance band, or no reading comes back, the interval is multiplied
+        by backoff_factor, so a settling heater does not hold the bus.
+        Stable means two consecutive reads with the middle sensor within
+        tolerance of the target and the edge sensor within tolerance of the
+        middle.
+        
+        Args:
+            min_poll: Shortest poll interval in seconds, > 0 (default WAIT_POLL_MIN)
+            max_poll: Longest poll interval in seconds (default WAIT_POLL_MAX)
+            backoff_factor: Growth of the interval per unchanged reading
+        """
+        min_poll = self.WAIT_POLL_MIN if min_poll is None else min_poll
+        max_poll = self.WAIT_POLL_MAX if max_poll is None else max_poll
+        # The backoff is capped at max_poll / min_poll and grows from min_poll
+        if min_poll <= 0:
+            raise ValueError("min_poll must be positive")
+        if max_poll < min_poll:
+            raise ValueError("max_poll must not be less than min_poll")
+        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        stable_reads = 0
+        delay = min_poll
+        backoff = 1.0
+        last = None
+        
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
             
-            if current_temp is not None:
-                if abs(current_temp - target_temp) <= tolerance:
-                    self.logger.info(f"Temperature stabilized at {current_temp:.1f}°C")
-                    return True
+            # The read itself is bounded by the deadline too, so a stalled
+            # exchange cannot push the wait past timeout. Cancelling it is safe:
+            # send_frames lets a started exchange finish on the transport's
+            # thread and drops frames that were still queued
+            try:
+                middle, edge = await asyncio.wait_for(self.get_temperatures_async(), timeout=remaining)
+            except asyncio.TimeoutError:
+                return False
+            
+            if middle is None:
+                # No reading: back off from the previous interval
+                delay = min(max_poll, delay * backoff_factor)
+            else:
+                error = abs(middle - target_temp)
+                
+                if error <= tolerance and edge is not None and abs(middle - edge) <= tolerance:
+                    stable_reads += 1
+                    if stable_reads >= 2:
+                        self.logger.info(f"Temperature stabilized at {middle:.1f}°C")
+                        return True
+                    backoff = 1.0  # Confirm stability promptly
+                else:
+                    stable_reads = 0
+                    if last is not None and abs(middle - last) < 0.1:
+                        backoff = min(backoff * backoff_factor, max_poll / min_poll)
+                    else:
+                        backoff = 1.0
+                last = middle
                 
-                self.logger.debug(f"Current: {current_temp:.1f}°C, Target: {target_temp:.1f}°C")
+                self.logger.debug(f"Current: {middle:.1f}°C, Target: {target_temp:.1f}°C")
+                delay = min(max_poll, max(min_poll, error * 0.5) * backoff)
             
-            await asyncio.sleep(5)
-        
-        return False
+            await asyncio.sleep(min(delay, max(0.0, deadline - loop.time())))
+    
+    def _format_protocol(self, temperature: float, speed: float, acceleration: int) -> tuple:
+        """Validate heat-shake setpoints and return their (ta, sv, sr) protocol fields."""
+        self._validate_temperature(temperature)
+        self._validate_speed(speed)
+        self._validate_acceleration(acceleration)
+        return (HHSCommands.format_temperature_bytes(temperature),
+                HHSCommands.format_speed(int(speed)),
+                HHSCommands.format_acceleration(acceleration))
+    
+    def _prepare_protocol(self, temperature: float, speed: float, acceleration: int = 1000):
+        """Validate and format a heat-shake protocol once for later heat_shake calls."""
+        self._prepared[(temperature, speed, acceleration)] = self._format_protocol(temperature, speed, acceleration)
     
     def _validate_temperature(self, temperature: float):
         """Validate temperature parameter."""
@@ -968,100 +1922,139 @@ class HeaterShaker:
         if not self.is_initialized:
             return True
         
-        try:
-            # Stop shaking
+        async def stop_and_unlock():
+            # The plate is only released once shaking has stopped
             await self.stop_shaking_async()
-            
-            # Turn off heating (Hamilton command)
-            await self.deactivate_heating()
-            
-            # Unlock plate
             await self.unlock_plate()
+        
+        try:
+            if self._supports_pipelining:
+                # Stop shaking and turn off heating (Hamilton command) concurrently;
+                # the transport coalesces the concurrent commands into one write
+                await asyncio.gather(
+                    stop_and_unlock(),
+                    self.deactivate_heating(),
+                    return_exceptions=True
+                )
+            else:
+                for step in (stop_and_unlock, self.deactivate_heating):
+                    try:
+                        await step()
+                    except Exception as e:
+                        self.logger.error("Shutdown step failed: %s", e)
             
-            # Disconnect
-            if self.comm_interface:
-                await self.comm_interface.disconnect()
+            # Disconnect (only once the last device on the port is done)
+            await self._release_transport()
             
             self.is_initialized = False
+            self.is_connected = False
             self.logger.info("Device shutdown complete")
             return True
             
         except Exception as e:
-            self.logger.error(f"Shutdown error: {e}")
+            self.logger.error("Shutdown error: %s", e)
             return False
     
-    @staticmethod
-    def list_available_ports():
-        """List available serial ports."""
+    @classmethod
+    def list_available_ports(cls, ttl: Optional[float] = None):
+        """
+        List available serial ports (rescanned at most once per _ports_cache_ttl).
+        
+        Args:
+            ttl: Maximum age in seconds of a reused scan (default _ports_cache_ttl;
+                0 forces a rescan)
+            
+        Returns:
+            Tuple of PortInfo; the same immutable tuple is returned until the next rescan
+        """
         if not SERIAL_AVAILABLE:
             print("pyserial not available")
-            return []
+            return ()
         
-        ports = serial.tools.list_ports.comports()
-        available_ports = []
+        # Port enumeration walks the OS device tree; reuse a recent scan
+        if ttl is None:
+            ttl = cls._ports_cache_ttl
+        if cls._ports_cache is not None and time.monotonic() - cls._ports_cache_ts < ttl:
+            return cls._ports_cache
         
-        for port in ports:
-            available_ports.append({
-                'device': port.device,
-                'description': port.description,
-                'manufacturer': port.manufacturer or 'Unknown'
-            })
+        if cls._comports is None:
+            from serial.tools.list_ports import comports
+            cls._comports = staticmethod(comports)
         
+        available_ports = tuple(PortInfo(port.device, port.description, port.manufacturer or 'Unknown')
+                                for port in cls._comports())
+        
+        cls._ports_cache = available_ports
+        cls._ports_cache_ts = time.monotonic()
         return available_ports
     
     def __repr__(self) -> str:
         """String representation."""
-        status = "initialized" if self.is_initialized else "not initialized"
-        return f"HeaterShaker(name='{self.name}', interface='{self.interface.value}', port='{self.port}', status={status})"
+        return self._repr_prefix + ("initialized)" if self.is_initialized else "not initialized)")
 
 
 # Test functions for debugging
 def test_commands():
     """Test command building and parsing."""
-    print("Testing Hamilton HHS command protocol...")
+    lines = ["Testing Hamilton HHS command protocol..."]  # Written out in one go at the end
+    build_into = HHSCommands.build_command_into
+    fmt_t = HHSCommands.format_temperature
+    parse_t = HHSCommands.parse_temperature_response
+    buf = bytearray(32)  # Scratch frame buffer shared by the build tests
     
-    # Test command building
-    cmd1 = HHSCommands.build_command(1, "TA", 123, ta="0370")
-    print(f"Set temperature command: {cmd1}")
+    # Test command building (frames shown without the CR/LF terminator)
+    n = build_into(buf, 1, "TA", 123, ta="0370")
+    lines.append(f"Set temperature command: {buf[:n - 2].decode('ascii')}")
     
-    cmd2 = HHSCommands.build_command(1, "SB", 124, st=0, sv="0800", sr="01000")
-    print(f"Start shaking command: {cmd2}")
+    n = build_into(buf, 1, "SB", 124, st=0, sv="0800", sr="01000")
+    lines.append(f"Start shaking command: {buf[:n - 2].decode('ascii')}")
     
     # Test temperature formatting
-    temp_str = HHSCommands.format_temperature(37.5)
-    print(f"Temperature 37.5°C formatted: {temp_str}")
+    temp_str = fmt_t(37.5)
+    lines.append(f"Temperature 37.5°C formatted: {temp_str}")
     
     # Test response parsing
     test_response = "T1RTid0001rt+0370 +0365"
-    temp_data = HHSCommands.parse_temperature_response(test_response)
-    print(f"Parsed temperature: {temp_data}")
+    temp_data = parse_t(test_response)
+    lines.append(f"Parsed temperature: {temp_data}")
+    
+    print("\n".join(lines))
+
+
+_BANNER = """\
+Hamilton Heater Shaker Controller
+========================================
+Dependencies:
+  pyserial: %s
+  pyusb: %s
+
+Command Protocol Test:
+"""
+
+_FOOTER = """
+To use this module:
+1. Import: from heater_shaker import HeaterShaker
+2. Create: hs = HeaterShaker(port='COM3')
+3. Use: hs.initialize(temp=25.0)
+4. Run: hs.heat_shake(300, 37.0, 800)
+5. Stop: hs.shutdown()
+
+Real Hamilton HHS command examples:
+- Set 37°C: T1TAid0001ta0370
+- Start shake: T1SBid0002st0sv0800sr01000
+- Get temp: T1RTid0003
+- Stop shake: T1SCid0004
+- Lock plate: T1LPid0005lp1
+
+USB Device ID: %s
+"""
 
 
 if __name__ == "__main__":
-    print("Hamilton Heater Shaker Controller")
-    print("=" * 40)
-    
-    # Check dependencies
-    print("Dependencies:")
-    print(f"  pyserial: {'✓ Available' if SERIAL_AVAILABLE else '✗ Not installed'}")
-    print(f"  pyusb: {'✓ Available' if USB_AVAILABLE else '✗ Not installed'}")
+    sys.stdout.write(_BANNER % ('✓ Available' if SERIAL_AVAILABLE else '✗ Not installed',
+                                '✓ Available' if USB_AVAILABLE else '✗ Not installed'))
     
     # Test command protocol
-    print("\nCommand Protocol Test:")
     test_commands()
     
-    print("\nTo use this module:")
-    print("1. Import: from heater_shaker import HeaterShaker")
-    print("2. Create: hs = HeaterShaker(port='COM3')")
-    print("3. Use: hs.initialize(temp=25.0)")
-    print("4. Run: hs.heat_shake(300, 37.0, 800)")
-    print("5. Stop: hs.shutdown()")
-    
-    print("\nReal Hamilton HHS command examples:")
-    print("- Set 37°C: T1TAid0001ta0370")
-    print("- Start shake: T1SBid0002st0sv0800sr01000")
-    print("- Get temp: T1RTid0003")
-    print("- Stop shake: T1SCid0004")
-    print("- Lock plate: T1LPid0005lp1")
-    
-    print(f"\nUSB Device ID: {HHSCommands.USB_VENDOR_ID:04X}:{HHSCommands.USB_PRODUCT_ID:04X}")
\ No newline at end of file
+    sys.stdout.write(_FOOTER % HHSCommands.USB_ID_STR)
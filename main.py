@@ -6,10 +6,12 @@ Modify the parameters below to test different protocols.
 """
 
 from heater_shaker import HeaterShaker
+import asyncio
+import logging
 import time
 
 
-def main():
+async def main():
     """Main test function for heater shaker operations."""
     
     # Protocol parameters - modify these for your test
@@ -49,7 +51,7 @@ def main():
     try:
         # Initialize the heater shaker
         print(f"\nInitializing heater shaker at {initial_temp}°C...")
-        success = heater_shaker.initialize(temp=initial_temp)
+        success = await heater_shaker.initialize_async(temperature=initial_temp)
         
         if not success:
             print("ERROR: Failed to initialize heater shaker")
@@ -63,7 +65,7 @@ def main():
         
         # Get initial readings
         print("\nGetting initial device status...")
-        current_temp = heater_shaker.get_temperature()
+        current_temp = await heater_shaker.get_temperature_async()
         if current_temp is not None:
             print(f"  Current temperature: {current_temp:.1f}°C")
         else:
@@ -76,7 +78,7 @@ def main():
         print(f"  Duration: {time_seconds} seconds ({time_seconds/60:.1f} minutes)")
         
         start_time = time.time()
-        success = heater_shaker.heat_shake(time_seconds, temperature, speed)
+        success = await heater_shaker.heat_shake_async(time_seconds, temperature, speed)
         end_time = time.time()
         
         if success:
@@ -89,7 +91,7 @@ def main():
         
         # Get final readings
         print("\nGetting final device status...")
-        final_temp = heater_shaker.get_temperature()
+        final_temp = await heater_shaker.get_temperature_async()
         if final_temp is not None:
             print(f"  Final temperature: {final_temp:.1f}°C")
         
@@ -99,7 +101,7 @@ def main():
         # Test temperature control
         test_temp = 30.0
         print(f"  Setting temperature to {test_temp}°C...")
-        if heater_shaker.set_temperature(test_temp):
+        if await heater_shaker.set_temperature_async(test_temp):
             print("  ✓ Temperature set successfully")
         else:
             print("  ✗ Failed to set temperature")
@@ -107,11 +109,11 @@ def main():
         # Test shaking control
         test_speed = 500
         print(f"  Starting shaking at {test_speed} steps/sec...")
-        if heater_shaker.start_shaking(speed=test_speed):
+        if await heater_shaker.start_shaking_async(speed=test_speed):
             print("  ✓ Shaking started")
-            time.sleep(5)  # Shake for 5 seconds
+            await asyncio.sleep(5)  # Shake for 5 seconds (the event loop stays free)
             
-            if heater_shaker.stop_shaking():
+            if await heater_shaker.stop_shaking_async():
                 print("  ✓ Shaking stopped")
             else:
                 print("  ✗ Failed to stop shaking")
@@ -123,7 +125,8 @@ def main():
         print("=" * 60)
         return True
         
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        # asyncio.run() delivers Ctrl+C to the running coroutine as a cancellation
         print("\n\nTest interrupted by user (Ctrl+C)")
         return False
         
@@ -136,13 +139,13 @@ def main():
         # Always shutdown properly
         print("\nShutting down heater shaker...")
         try:
-            heater_shaker.shutdown()
+            await heater_shaker.shutdown_async()
             print("✓ Heater shaker shutdown complete")
         except Exception as e:
             print(f"Warning: Error during shutdown: {e}")
 
 
-def test_connection_only():
+async def test_connection_only():
     """Quick test to verify device connection without running protocol."""
     
     print("Testing device connection...")
@@ -153,7 +156,7 @@ def test_connection_only():
         ports = HeaterShaker.list_available_ports()
         if ports:
             for port in ports:
-                print(f"  {port['device']}: {port['description']}")
+                print(f"  {port.device}: {port.description}")
         else:
             print("  No serial ports found")
     except Exception as e:
@@ -164,10 +167,10 @@ def test_connection_only():
     heater_shaker = HeaterShaker()
     
     try:
-        success = heater_shaker.initialize(temp=25.0)
+        success = await heater_shaker.initialize_async(temperature=25.0)
         if success:
             print("✓ Connection successful!")
-            temp = heater_shaker.get_temperature()
+            temp = await heater_shaker.get_temperature_async()
             if temp is not None:
                 print(f"  Current temperature: {temp:.1f}°C")
         else:
@@ -175,10 +178,26 @@ def test_connection_only():
     except Exception as e:
         print(f"✗ Connection error: {e}")
     finally:
-        heater_shaker.shutdown()
+        await heater_shaker.shutdown_async()
+
+
+def run_invalid_choice():
+    """Fallback for unknown menu choices: run the full test."""
+    print("Invalid choice. Running full test...")
+    asyncio.run(main())
+
+
+# Menu choice -> action; add an entry here to extend the menu
+MENU_ACTIONS = {
+    "1": lambda: asyncio.run(main()),
+    "2": lambda: asyncio.run(test_connection_only()),
+    "3": lambda: print("Exiting..."),
+}
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    
     print("Hamilton Heater Shaker Test")
     print("1. Run full test protocol")
     print("2. Test connection only")
@@ -186,12 +205,7 @@ if __name__ == "__main__":
     
     choice = input("Enter choice (1-3): ").strip()
     
-    if choice == "1":
-        main()
-    elif choice == "2":
-        test_connection_only()
-    elif choice == "3":
-        print("Exiting...")
-    else:
-        print("Invalid choice. Running full test...")
-        main()
\ No newline at end of file
+    try:
+        MENU_ACTIONS.get(choice, run_invalid_choice)()
+    except KeyboardInterrupt:
+        pass  # Already reported; asyncio.run() re-raises Ctrl+C after cleanup
\ No newline at end of file